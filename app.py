@@ -3,12 +3,67 @@ Streamlit UI for WhatsApp Bulk Message Sender
 Uses Selenium to open WhatsApp Web once, then send messages one by one
 """
 
+import asyncio
+import atexit
+import io
+import shutil
+
 import streamlit as st
 import pandas as pd
-import os
 from pathlib import Path
 from datetime import datetime
-from whatsapp_sender import WhatsAppBulkSender
+from whatsapp_sender import WhatsAppBulkSender, PROFILE_DIR
+import cloud_sender
+
+
+@st.cache_data(show_spinner=False)
+def _load_csv(file_bytes: bytes) -> pd.DataFrame:
+    """Parse uploaded CSV once per unique file - cached across reruns"""
+    return pd.read_csv(io.BytesIO(file_bytes), encoding='utf-8')
+
+
+def _show_results(result: dict, failed: list):
+    """Render summary metrics and any failed sends"""
+    st.divider()
+    st.success(f"✅ Completed! Sent {result['sent']}/{result['total']} messages")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("✅ Sent", result['sent'])
+    with col2:
+        st.metric("❌ Failed", result['failed'])
+    with col3:
+        st.metric("📊 Success Rate", f"{result['success_rate']:.1f}%")
+
+    if failed:
+        st.error("**Failed Messages:**")
+        for fail in failed:
+            st.write(f"• {fail['name']}: {fail['error']}")
+
+
+@st.cache_data(show_spinner=False)
+def _template_csv() -> str:
+    """Build the downloadable template CSV once - cached across reruns"""
+    template_df = pd.DataFrame({
+        'phone_number': ['+9190000002212'],
+        'name': ['Chandran Marimuthu']
+    })
+    return template_df.to_csv(index=False)
+
+
+@st.cache_data(show_spinner=False)
+def _example_df() -> pd.DataFrame:
+    """Build the tab-2 example DataFrame once - cached across reruns"""
+    return pd.DataFrame({
+        'phone_number': ['+919876543210'],
+        'name': ['Chandran Marimuthu']
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _example_csv() -> str:
+    """Render the example CSV string once - cached across reruns"""
+    return _example_df().to_csv(index=False)
 
 # Page config
 st.set_page_config(
@@ -18,21 +73,67 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Keep the sender (and its logged-in browser) alive across reruns so the
+# QR scan is paid once, not on every widget interaction
+if 'sender' not in st.session_state:
+    st.session_state.sender = None
+
 st.title("💬 WhatsApp Bulk Messenger")
 st.markdown("*Send automated messages to multiple WhatsApp contacts from CSV*")
 
 # Sidebar
 with st.sidebar:
     st.header("⚙️ Settings")
-    
-    delay = st.slider(
-        "Delay between messages (seconds)",
-        min_value=2,
+
+    backend = st.radio(
+        "Sending backend",
+        ["Selenium (WhatsApp Web)", "Cloud API"],
+        help="Selenium drives WhatsApp Web in a browser (no API access needed). "
+             "Cloud API sends over HTTP - much faster, but requires a Meta "
+             "Business account with API access."
+    )
+
+    if backend == "Cloud API":
+        api_token = st.text_input("Access token", type="password")
+        api_phone_id = st.text_input("Phone number ID")
+        headless = False
+    else:
+        api_token = api_phone_id = None
+        headless = st.checkbox(
+            "Headless mode (requires saved WhatsApp session)",
+            value=False,
+            help="Runs Chrome without a window and skips image loading - "
+                 "faster per message, but the QR code can't be scanned. "
+                 "Do a first run with this off."
+        )
+
+        if st.button("🔄 Reset session", help="Forget the saved WhatsApp login"):
+            shutil.rmtree(PROFILE_DIR, ignore_errors=True)
+            st.success("Saved session cleared - next run will ask for a QR scan")
+
+        if st.session_state.sender is not None:
+            if st.button("🚪 Close Browser"):
+                st.session_state.sender.close_browser()
+                st.session_state.sender = None
+                st.success("Browser closed")
+
+    rate_per_minute = st.slider(
+        "Messages per minute",
+        min_value=1,
         max_value=60,
-        value=5,
-        help="Time to pause between each message to avoid rate limiting"
+        value=12,
+        help="Sending rate - keep this conservative to avoid WhatsApp "
+             "flagging the account"
     )
-    
+
+    burst = st.slider(
+        "Burst size",
+        min_value=1,
+        max_value=10,
+        value=3,
+        help="How many messages may go out back-to-back before pacing kicks in"
+    )
+
     st.divider()
     
     st.subheader("📖 How to Use")
@@ -72,13 +173,9 @@ with tab1:
     
     with col2:
         if st.button("📥 Download Template", width='stretch'):
-            template_df = pd.DataFrame({
-                'phone_number': ['+9190000002212'],
-                'name': ['Chandran Marimuthu']
-            })
             st.download_button(
                 label="Download template.csv",
-                data=template_df.to_csv(index=False),
+                data=_template_csv(),
                 file_name="template.csv",
                 mime="text/csv",
                 use_container_width=True
@@ -87,7 +184,7 @@ with tab1:
     # Load and display CSV
     if uploaded_file:
         try:
-            df = pd.read_csv(uploaded_file, encoding='utf-8')
+            df = _load_csv(uploaded_file.getvalue())
             
             st.success(f"✅ Loaded {len(df)} contacts")
             
@@ -108,7 +205,7 @@ with tab1:
             # Preview message
             if df is not None and len(df) > 0:
                 first_contact = df.iloc[0]
-                preview_msg = message_template.format(**first_contact.to_dict())
+                preview_msg = message_template.format_map(first_contact.to_dict())
                 with st.expander("👁️ Preview Message"):
                     st.info(preview_msg)
             
@@ -119,11 +216,11 @@ with tab1:
             
             with col1:
                 delay = st.number_input(
-                    "Delay between messages (seconds)",
+                    "Send confirmation timeout (seconds)",
                     min_value=2,
                     max_value=60,
                     value=5,
-                    help="Wait time between sending each message"
+                    help="Max time to wait for each message's pending tick to clear"
                 )
             
             with col2:
@@ -148,57 +245,77 @@ with tab1:
             st.divider()
             
             if st.button("🚀 Start Sending Messages", use_container_width=True, type="primary"):
-                
-                # Save CSV to temp file
-                temp_csv = "temp_contacts.csv"
-                df.to_csv(temp_csv, index=False, encoding='utf-8')
-                
-                # Initialize sender
-                sender = WhatsAppBulkSender(temp_csv, wait_time=delay)
-                
-                if sender.load_contacts():
-                    # Filter contacts by row range
-                    contacts_to_send = sender.contacts[start_row-1:end_row]
-                    
-                    st.warning("⏳ WhatsApp Web will open... Scan QR code when it appears")
-                    
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    errors_found = []
-                    
-                    with st.spinner(f"Sending {len(contacts_to_send)} messages..."):
+
+                # Pass the selected rows directly - no temp CSV round-trip
+                contacts_df = df.iloc[start_row-1:end_row].reset_index(drop=True)
+
+                if backend == "Cloud API":
+                    if not api_token or not api_phone_id:
+                        st.error("Enter your access token and phone number ID in the sidebar")
+                    else:
+                        contacts = contacts_df.to_dict('records')
+
+                        with st.spinner(f"Sending {len(contacts)} messages via Cloud API..."):
+                            try:
+                                result = asyncio.run(cloud_sender.send_all(
+                                    api_token, api_phone_id, contacts, message_template,
+                                    rate_per_minute=rate_per_minute, burst=burst
+                                ))
+                                _show_results(
+                                    result,
+                                    [r for r in result['results'] if not r['ok']]
+                                )
+                            except Exception as e:
+                                st.error(f"Error: {str(e)}")
+
+                else:
+                    sender = st.session_state.sender
+                    if sender is None:
+                        sender = WhatsAppBulkSender(contacts_df, wait_time=delay, headless=headless)
+                        loaded = sender.load_contacts()
+                        if loaded:
+                            st.session_state.sender = sender
+                            # Don't leak a Chrome process if Streamlit exits
+                            atexit.register(sender.close_browser)
+                    else:
+                        # Reuse the open browser - just swap in this batch
+                        loaded = sender.load_from_dataframe(contacts_df)
+
+                    if loaded and sender.skipped_df is not None and not sender.skipped_df.empty:
+                        st.warning(f"⚠️ Skipped {len(sender.skipped_df)} invalid or duplicate rows")
+                        st.dataframe(sender.skipped_df, use_container_width=True, hide_index=True)
+
+                    if loaded:
+                        st.warning("⏳ WhatsApp Web will open... Scan QR code when it appears")
+
+                        progress_bar = st.progress(0)
+                        status_text = st.empty()
+
                         try:
-                            # Use send_bulk_messages which opens browser once
-                            sender.contacts = contacts_to_send
-                            result = sender.send_bulk_messages(message_template, delay)
-                            
-                            # Show results
-                            st.divider()
-                            st.success(f"✅ Completed! Sent {result['sent']}/{result['total']} messages")
-                            
-                            # Show metrics
-                            col1, col2, col3 = st.columns(3)
-                            with col1:
-                                st.metric("✅ Sent", result['sent'])
-                            with col2:
-                                st.metric("❌ Failed", result['failed'])
-                            with col3:
-                                st.metric("📊 Success Rate", f"{result['success_rate']:.1f}%")
-                            
-                            # Show failed messages if any
-                            if result['failed'] > 0:
-                                st.error("**Failed Messages:**")
-                                report = sender.get_report()
-                                for fail in report['failed']:
-                                    st.write(f"• {fail['name']}: {fail['error']}")
-                        
+                            # iter_send_bulk opens the browser once and yields
+                            # a progress event after each contact
+                            for ev in sender.iter_send_bulk(
+                                message_template, delay,
+                                rate_per_minute=rate_per_minute, burst=burst,
+                                close_when_done=False
+                            ):
+                                progress_bar.progress(ev['index'] / ev['total'])
+                                status_text.text(
+                                    f"[{ev['index']}/{ev['total']}] "
+                                    f"{ev['name']}: {'✓' if ev['ok'] else '✗'}"
+                                )
+
+                            total = len(sender.contacts_df)
+                            result = {
+                                'total': total,
+                                'sent': sender.n_sent,
+                                'failed': sender.n_failed,
+                                'success_rate': (sender.n_sent / total * 100) if total else 0
+                            }
+                            _show_results(result, sender.get_report()['failed'])
                         except Exception as e:
                             st.error(f"Error: {str(e)}")
-                    
-                    # Cleanup
-                    if os.path.exists(temp_csv):
-                        os.remove(temp_csv)
-            
+
             else:
                 st.info("📱 Click button above to start sending messages")
         
@@ -222,22 +339,15 @@ with tab2:
     """)
     
     st.subheader("Example CSV")
-    example_data = {
-        'phone_number': ['+919876543210'],
-        'name': ['Chandran Marimuthu']
-    }
-    
-    example_df = pd.DataFrame(example_data)
-    st.dataframe(example_df, use_container_width=True, hide_index=True)
+    st.dataframe(_example_df(), use_container_width=True, hide_index=True)
     
     st.subheader("Example Message Template")
     st.code("""Hi {name}! 👋""")
     
     st.subheader("Download Template")
-    csv_data = example_df.to_csv(index=False)
     st.download_button(
         label="⬇️ Download Example CSV",
-        data=csv_data,
+        data=_example_csv(),
         file_name="whatsapp_contacts_example.csv",
         mime="text/csv",
         use_container_width=True
@@ -246,9 +356,26 @@ with tab2:
 # ==================== TAB 3: REPORTS ====================
 with tab3:
     st.subheader("📊 Sending Reports")
-    
-    st.info("Reports will appear here after you send messages")
-    
+
+    # The sender streams outcomes to these CSVs during the batch, so they
+    # are available (and current) even mid-send or after a crash
+    report_files = [("✅ Sent messages", Path("sent.csv")),
+                    ("❌ Failed messages", Path("failed.csv"))]
+    found_reports = False
+    for label, path in report_files:
+        if path.exists():
+            found_reports = True
+            st.download_button(
+                label=f"⬇️ Download {path.name}",
+                data=path.read_text(encoding='utf-8'),
+                file_name=path.name,
+                mime="text/csv",
+                key=f"dl_{path.name}"
+            )
+
+    if not found_reports:
+        st.info("Reports will appear here after you send messages")
+
     st.markdown("""
     ### What gets tracked:
     - ✅ Successfully sent messages
@@ -4,62 +4,203 @@ Automated tool to send WhatsApp messages to multiple contacts from CSV
 Uses Selenium to keep browser session open and send messages one by one
 """
 
+import atexit
+import csv
 import pandas as pd
+import queue
+import re
+import string
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import quote
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+# Configure logging through a queue: producers enqueue records lock-free
+# and a background thread does the actual stderr writes. The handler goes
+# on the root logger so other modules (cloud_sender) share the same path.
+_log_queue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 )
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
+
 logger = logging.getLogger(__name__)
 
+_log_listener = QueueListener(_log_queue, _stream_handler)
+_log_listener.start()
+# Flush queued records before the interpreter exits
+atexit.register(_log_listener.stop)
+
+# Chrome profile dir that keeps the WhatsApp Web session between runs
+PROFILE_DIR = Path.home() / ".whatsapp_sender_profile"
+
+# Formatted phone numbers must look like +<8-15 digits>
+PHONE_RE = re.compile(r'^\+\d{8,15}$')
+
+
+@lru_cache(maxsize=4096)
+def _render_cached(template: str, fields: tuple, values: tuple) -> str:
+    """Memoized template fill - pays off when many contacts share the same
+    values for the referenced fields (e.g. a {city} grouping)"""
+    return template.format_map(dict(zip(fields, values)))
+
+
+class TokenBucket:
+    """Token-bucket rate limiter - smooths bursts while decoupling pacing
+    from per-message latency"""
+
+    def __init__(self, rate_per_min: float, burst: int = 1):
+        self.rate = rate_per_min / 60.0  # tokens per second
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            time.sleep((1 - self.tokens) / self.rate)
+
 
 class WhatsAppBulkSender:
     """Send WhatsApp messages to bulk contacts using Selenium (single browser session)"""
-    
-    def __init__(self, csv_file: str, wait_time: int = 2):
+
+    # WhatsApp Web selectors
+    SEARCH_BOX_XPATH = "//div[@contenteditable='true'][@data-tab='3']"
+    SEARCH_RESULT_XPATH = "//div[@id='pane-side']//div[@role='listitem']"
+    # Open chat must carry the target number in its header title or in a
+    # message JID before we type into it
+    CHAT_VERIFY_XPATH = ("//div[@id='main'][.//header//span[@title='{phone}']"
+                         " or .//*[contains(@data-id, '{digits}@c.us')]]")
+    MSG_BOX_XPATH = "//div[@contenteditable='true'][@data-tab='10']"
+    SEND_BTN_XPATH = "//button[@aria-label='Send']"
+    SEND_URL_BASE = "https://web.whatsapp.com/send/?phone="
+    # Pending clock on the most recent outgoing message only
+    MSG_PENDING_XPATH = ("(//div[@id='main']//div[contains(@class,'message-out')])"
+                         "[last()]//span[@data-icon='msg-time']")
+
+
+    def __init__(self, source=None, wait_time: int = 2, headless: bool = False,
+                 profile_dir=None):
         """
         Initialize the bulk sender
-        
+
         Args:
-            csv_file: Path to CSV file with contacts
+            source: Path to CSV file with contacts, or a pandas DataFrame
+                    (avoids the CSV round-trip when data is already in memory)
             wait_time: Time to wait between messages (seconds)
+            headless: Run Chrome headless with image loading disabled.
+                      Only works with a saved WhatsApp session - the QR
+                      code needs a visible browser on first run.
+            profile_dir: Chrome profile directory for session persistence
+                         (defaults to PROFILE_DIR; parallel workers each
+                         get their own)
         """
-        self.csv_file = csv_file
+        self.source = source
         self.wait_time = wait_time
-        self.contacts = []
-        self.sent_messages = []
-        self.failed_messages = []
+        self.headless = headless
+        self.profile_dir = Path(profile_dir) if profile_dir else PROFILE_DIR
+        self._service = None  # shared chromedriver Service for parallel workers
+        self.contacts_df = None
+        self.skipped_df = None  # rows dropped as invalid/duplicate at load
+        # Per-message outcomes stream to these CSVs; only counters stay in RAM
+        self.sent_csv = Path('sent.csv')
+        self.failed_csv = Path('failed.csv')
+        self.n_sent = 0
+        self.n_failed = 0
+        self._sent_w = None
+        self._fail_w = None
         self.driver = None
-    
+        self._primed = False  # True once the WhatsApp Web SPA is fully loaded
+        self._msg_box = None  # cached chat-input element, relocated when stale
+        self._send_btn = None  # cached send-button element, relocated when stale
+
     def load_contacts(self) -> bool:
-        """Load contacts from CSV file"""
+        """Load contacts from the source (CSV path or DataFrame)"""
+        if isinstance(self.source, pd.DataFrame):
+            return self.load_from_dataframe(self.source)
+
         try:
-            df = pd.read_csv(self.csv_file, encoding='utf-8')
-            
-            # Validate required columns
-            required_cols = ['phone_number', 'name']
-            if not all(col in df.columns for col in required_cols):
-                logger.error(f"CSV must contain columns: {required_cols}")
-                return False
-            
-            self.contacts = df.to_dict('records')
-            logger.info(f"Loaded {len(self.contacts)} contacts from {self.csv_file}")
-            return True
+            try:
+                # pyarrow backend parses faster and keeps strings unboxed
+                df = pd.read_csv(self.source, encoding='utf-8',
+                                 dtype_backend='pyarrow')
+            except ImportError:
+                df = pd.read_csv(self.source, encoding='utf-8')
+            return self.load_from_dataframe(df)
         except FileNotFoundError:
-            logger.error(f"CSV file not found: {self.csv_file}")
+            logger.error(f"CSV file not found: {self.source}")
             return False
         except Exception as e:
             logger.error(f"Error loading CSV: {str(e)}")
             return False
+
+    def load_from_dataframe(self, df: pd.DataFrame) -> bool:
+        """Load contacts directly from an in-memory DataFrame (no disk I/O)"""
+        # Validate required columns
+        required_cols = ['phone_number', 'name']
+        if not all(col in df.columns for col in required_cols):
+            logger.error(f"Contacts must contain columns: {required_cols}")
+            return False
+
+        # Drop rows that would only waste a browser navigation: missing
+        # fields, duplicate numbers, or numbers that can't be valid
+        n_raw = len(df)
+        df = df.dropna(subset=['phone_number', 'name']).copy()
+        df['_phone_fmt'] = self._preformat_phones(df)
+        df = df.drop_duplicates(subset='_phone_fmt', keep='first')
+
+        valid = df['_phone_fmt'].str.match(PHONE_RE)
+        self.skipped_df = df[~valid].drop(columns='_phone_fmt')
+        df = df[valid].reset_index(drop=True)
+
+        # Keep the DataFrame (column-wise storage) instead of exploding it
+        # into one Python dict per contact - the send loop indexes columns
+        self.contacts_df = df
+        if len(df) < n_raw:
+            logger.warning(f"Skipped {n_raw - len(df)} invalid/duplicate rows")
+        logger.info(f"Loaded {len(df)} contacts")
+        return True
+
+    @staticmethod
+    def _preformat_phones(df: pd.DataFrame) -> pd.Series:
+        """Format the whole phone column in one vectorized pandas pass"""
+        s = df['phone_number'].astype(str).str.strip()
+        # One blank cell upstream turns the whole column float, so numbers
+        # stringify as "9943151455.0" and would all fail validation
+        s = s.str.replace(r'\.0$', '', regex=True)
+        s = s.str.replace(r'[-\s()]', '', regex=True)
+        # If no +, assume India (+91) - same rules as format_phone_number
+        s = s.where(
+            s.str.startswith('+'),
+            other='+' + s.where(s.str.startswith('91'), other='91' + s)
+        )
+        return s
     
     def format_phone_number(self, phone: str) -> str:
         """Format phone number to international format"""
@@ -85,22 +226,50 @@ class WhatsAppBulkSender:
             
             # Chrome options
             chrome_options = Options()
-            # Don't use headless mode - user needs to see and interact
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
-            
-            # Initialize Chrome driver
-            self.driver = webdriver.Chrome(options=chrome_options)
+            chrome_options.add_argument("--disable-extensions")
+
+            # Persist the Chrome profile so WhatsApp Web stays logged in
+            # and the QR scan only happens on the very first run
+            self.profile_dir.mkdir(exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+
+            if self.headless:
+                # Headless + no images: less rendering and fewer bytes per
+                # chat open. Requires a saved session (QR scan needs a GUI).
+                chrome_options.add_argument("--headless=new")
+                chrome_options.add_argument("--disable-gpu")
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+                chrome_options.add_experimental_option(
+                    "prefs", {"profile.managed_default_content_settings.images": 2}
+                )
+
+            # Initialize Chrome driver (reusing a shared Service if set)
+            if self._service is not None:
+                self.driver = webdriver.Chrome(service=self._service, options=chrome_options)
+            else:
+                self.driver = webdriver.Chrome(options=chrome_options)
+            self._primed = False
+            self._msg_box = self._send_btn = None
             
             # Open WhatsApp Web
             self.driver.get("https://web.whatsapp.com")
             
-            # Wait for user to scan QR code (30 seconds timeout)
-            logger.info("Waiting for QR code scan... (timeout: 30 seconds)")
-            WebDriverWait(self.driver, 30).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//div[@contenteditable='true'][@data-tab='3']"))
-            )
-            
+            chat_list_locator = (By.XPATH, "//div[@contenteditable='true'][@data-tab='3']")
+            try:
+                # With a saved session the chat list appears within seconds
+                WebDriverWait(self.driver, 3).until(
+                    EC.presence_of_all_elements_located(chat_list_locator)
+                )
+                logger.info("✓ Restored saved WhatsApp session")
+            except TimeoutException:
+                # Fresh session - wait for user to scan the QR code
+                logger.info("Waiting for QR code scan... (timeout: 30 seconds)")
+                WebDriverWait(self.driver, 30).until(
+                    EC.presence_of_all_elements_located(chat_list_locator)
+                )
+
             logger.info("✓ WhatsApp Web loaded successfully!")
             return True
             
@@ -128,108 +297,404 @@ class WhatsAppBulkSender:
             return False
         
         try:
-            formatted_phone = self.format_phone_number(phone)
-            logger.info(f"Sending to {name} ({formatted_phone})...")
-            
-            # Open chat with contact
-            # Use WhatsApp Web API URL format
-            chat_url = f"https://web.whatsapp.com/send/?phone={formatted_phone}&text={message}"
-            self.driver.get(chat_url)
-            
-            # Wait for message input field to appear
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//button[@aria-label='Send']"))
-            )
-            
-            # Find and click Send button
-            send_button = self.driver.find_element(By.XPATH, "//button[@aria-label='Send']")
-            send_button.click()
-            
-            logger.info(f"✓ Message sent to {name} ({formatted_phone})")
-            self.sent_messages.append({
-                'name': name,
-                'phone': formatted_phone,
-                'timestamp': datetime.now(),
-                'status': 'sent'
-            })
-            
-            # Wait between messages
-            time.sleep(self.wait_time)
+            # The bulk path passes numbers pre-formatted by _preformat_phones
+            formatted_phone = phone if phone.startswith('+') else self.format_phone_number(phone)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Sending to {name} ({formatted_phone})...")
+
+            if not self._primed:
+                # First message: load the SPA once via the send URL
+                self._navigate_and_send(formatted_phone, message)
+                self._primed = True
+            elif self._switch_chat(formatted_phone):
+                # SPA already loaded and the in-page search provably opened
+                # the right chat - type into it without a page reload
+                self._type_and_send(message)
+            else:
+                # Search only finds saved contacts and existing chats; for
+                # a new number fall back to the send URL rather than type
+                # into whatever chat is currently open
+                self._navigate_and_send(formatted_phone, message)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"✓ Message sent to {name} ({formatted_phone})")
+            self.n_sent += 1
+            if self._sent_w:
+                # Raw integer timestamp - cheaper than datetime.now() and
+                # only turned into ISO text when the report is read back
+                self._sent_w.writerow([name, formatted_phone, time.time_ns(), 'sent'])
             return True
-        
+
         except Exception as e:
             error_msg = str(e)
             log_msg = f"✗ Failed to send to {name} ({phone}): {error_msg}"
             logger.error(log_msg)
-            self.failed_messages.append({
-                'name': name,
-                'phone': phone,
-                'timestamp': datetime.now(),
-                'error': error_msg
-            })
+            self.n_failed += 1
+            if self._fail_w:
+                self._fail_w.writerow([name, phone, time.time_ns(), error_msg])
             return False
     
-    def send_bulk_messages(self, message: str, delay_seconds: int = 5) -> dict:
+    def _get_cached_element(self, cached, xpath):
+        """Return a cached element handle, relocating it only if the SPA
+        rerender made it stale - avoids a full-DOM XPath walk per message"""
+        if cached is not None:
+            try:
+                cached.is_enabled()
+                return cached
+            except StaleElementReferenceException:
+                pass
+        return WebDriverWait(self.driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, xpath))
+        )
+
+    def _get_msg_box(self):
+        self._msg_box = self._get_cached_element(self._msg_box, self.MSG_BOX_XPATH)
+        return self._msg_box
+
+    def _get_send_btn(self):
+        self._send_btn = self._get_cached_element(self._send_btn, self.SEND_BTN_XPATH)
+        return self._send_btn
+
+    def _navigate_and_send(self, phone: str, message: str):
+        """Open the chat via the send URL (full page load) and click Send.
+        quote() the body - raw &, #, newlines and emoji would otherwise
+        corrupt the query string and fail silently."""
+        chat_url = f"{self.SEND_URL_BASE}{phone}&text={quote(message, safe='')}"
+        self.driver.get(chat_url)
+        # The reload invalidates any cached element handles
+        self._msg_box = self._send_btn = None
+
+        # Wait for message input field to appear
+        WebDriverWait(self.driver, 10).until(
+            EC.presence_of_all_elements_located((By.XPATH, self.SEND_BTN_XPATH))
+        )
+
+        # Find and click Send button
+        self._get_send_btn().click()
+
+    def _switch_chat(self, phone: str) -> bool:
+        """Try to open a chat via the in-page search box (no page reload)
+
+        Returns True only once the conversation pane provably belongs to
+        the target number. A miss (search matches only saved contacts and
+        existing chats, so new numbers never hit) returns False and the
+        caller must fall back to the send URL - typing blind would land
+        the message in whatever chat is currently open.
         """
-        Send messages to all loaded contacts using single browser session
-        
+        search_box = WebDriverWait(self.driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, self.SEARCH_BOX_XPATH))
+        )
+        search_box.click()
+        # Clear any leftover text from a previous search
+        search_box.send_keys(Keys.CONTROL, 'a')
+        search_box.send_keys(Keys.DELETE)
+        search_box.send_keys(phone)
+
+        try:
+            # Search results populate asynchronously - wait for the top
+            # hit instead of firing Enter into an empty list
+            WebDriverWait(self.driver, 5).until(
+                EC.element_to_be_clickable((By.XPATH, self.SEARCH_RESULT_XPATH))
+            ).click()
+
+            # Trust the switch only when the open chat references the
+            # target number (header title or a message JID carrying it)
+            verify_xpath = self.CHAT_VERIFY_XPATH.format(
+                phone=phone, digits=phone.lstrip('+'))
+            WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located((By.XPATH, verify_xpath))
+            )
+            return True
+        except TimeoutException:
+            # No verifiable hit - clear the box and report the miss
+            search_box.send_keys(Keys.CONTROL, 'a')
+            search_box.send_keys(Keys.DELETE)
+            return False
+
+    def _type_and_send(self, message: str):
+        """Type the message into the open chat and hit Enter to send"""
+        msg_box = self._get_msg_box()
+        actions = ActionChains(self.driver)
+        actions.click(msg_box)
+        # Shift+Enter keeps newlines inside the message; plain Enter sends
+        for i, line in enumerate(message.split('\n')):
+            if i:
+                actions.key_down(Keys.SHIFT).send_keys(Keys.ENTER).key_up(Keys.SHIFT)
+            actions.send_keys(line)
+        actions.send_keys(Keys.ENTER)
+        actions.perform()
+
+    def _wait_until_sent(self, timeout: int):
+        """Wait until the latest outgoing message loses its pending clock"""
+        if not self.driver:
+            return
+        try:
+            # The clock renders a beat after the click - wait for it to
+            # show up first, or until_not below returns before the send
+            # has even registered and the loop races on to the next chat
+            WebDriverWait(self.driver, 2).until(
+                EC.presence_of_element_located((By.XPATH, self.MSG_PENDING_XPATH))
+            )
+        except TimeoutException:
+            # Never appeared within the grace period - treat as already sent
+            return
+        try:
+            WebDriverWait(self.driver, timeout).until_not(
+                EC.presence_of_element_located((By.XPATH, self.MSG_PENDING_XPATH))
+            )
+        except TimeoutException:
+            # Still pending after the timeout - WhatsApp keeps delivering
+            # in the background, so move on rather than stall the batch
+            pass
+
+    def iter_send_bulk(self, message: str, delay_seconds: int = 5,
+                       rate_per_minute: float = None, burst: int = 1,
+                       close_when_done: bool = True) -> Iterator[dict]:
+        """
+        Send messages to all loaded contacts, yielding one progress event
+        per contact so callers can update their UI incrementally (and stop
+        the batch early by breaking out of the loop).
+
         Args:
             message: Message template (use {name} for personalization)
-            delay_seconds: Delay between messages
-        
-        Returns:
-            Dict with summary statistics
+            delay_seconds: Max time to wait for each send confirmation
+            rate_per_minute: Pace sends with a token bucket at this rate
+                             (None = no pacing beyond the confirmation wait)
+            burst: Token bucket burst size
+            close_when_done: Quit the browser after the batch. Pass False
+                             to keep the session open for further batches.
+
+        Yields:
+            Dicts with keys: index, total, name, phone, ok
+
+        Raises:
+            RuntimeError: If no contacts are loaded or WhatsApp Web fails to open
         """
-        if not self.contacts:
-            logger.error("No contacts loaded. Call load_contacts() first.")
-            return None
-        
-        # Open WhatsApp Web once
-        if not self.open_whatsapp_web():
-            return None
-        
-        logger.info(f"Starting bulk send to {len(self.contacts)} contacts")
-        
+        if self.contacts_df is None or self.contacts_df.empty:
+            raise RuntimeError("No contacts loaded. Call load_contacts() first.")
+
+        # Open WhatsApp Web once, reusing an already-open session if any
+        if self.driver is None and not self.open_whatsapp_web():
+            raise RuntimeError("Failed to open WhatsApp Web")
+
+        # Fresh per-batch report files and counters (the sender may be
+        # reused across batches). Streaming to disk keeps memory O(1) and
+        # the report survives a crash mid-batch.
+        self.n_sent = 0
+        self.n_failed = 0
+        sent_f = open(self.sent_csv, 'w', newline='', encoding='utf-8')
+        fail_f = open(self.failed_csv, 'w', newline='', encoding='utf-8')
+        self._sent_w = csv.writer(sent_f)
+        self._fail_w = csv.writer(fail_f)
+        self._sent_w.writerow(['name', 'phone', 'ts_ns', 'status'])
+        self._fail_w.writerow(['name', 'phone', 'ts_ns', 'error'])
+
+        total = len(self.contacts_df)
+        logger.info(f"Starting bulk send to {total} contacts")
+
+        bucket = TokenBucket(rate_per_minute, burst) if rate_per_minute else None
+
+        # Column arrays instead of one dict per contact - cheaper to build
+        # and to index for large lists
+        phones = self.contacts_df['_phone_fmt'].astype(str).to_numpy()
+        names = self.contacts_df['name'].astype(str).to_numpy()
+
+        # Parse the template once instead of re-parsing it per contact
+        fmt_fields = [f for _, f, _, _ in string.Formatter().parse(message) if f]
+        if not fmt_fields:
+            # Constant template (same blast to everyone) - nothing to format
+            def render(i):
+                return message
+        elif fmt_fields == ['name']:
+            # Common case: only {name} is used - plain replace beats the formatter
+            def render(i):
+                return message.replace('{name}', names[i])
+        else:
+            # Pull only the columns the template actually references
+            field_cols = {c: self.contacts_df[c].to_numpy()
+                          for c in self.contacts_df.columns if c in set(fmt_fields)}
+
+            if 'name' in field_cols:
+                # {name} is effectively unique per contact - a cache would
+                # just thrash, so format directly
+                def render(i):
+                    return message.format_map({c: col[i] for c, col in field_cols.items()})
+            else:
+                # Low-cardinality fields ({city}, {plan}, ...) repeat across
+                # contacts - reuse the rendered message
+                fields = tuple(field_cols)
+                cols = tuple(field_cols.values())
+
+                def render(i):
+                    return _render_cached(message, fields,
+                                          tuple(col[i] for col in cols))
+
         try:
-            for i, contact in enumerate(self.contacts, 1):
-                phone = contact.get('phone_number', '')
-                name = contact.get('name', 'Unknown')
-                
+            for i in range(total):
+                phone = phones[i]
+                name = names[i]
+
                 # Personalize message
-                personalized_msg = message.format(**contact)
-                
-                logger.info(f"[{i}/{len(self.contacts)}] Sending to {name}...")
-                
-                self.send_message(phone, personalized_msg, name)
-                
-                # Delay between messages
-                if i < len(self.contacts):
-                    time.sleep(delay_seconds)
-        
+                personalized_msg = render(i)
+
+                # Per-message progress stays at DEBUG - the batch-level INFO
+                # lines are enough, and the guard skips the f-string when off
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[{i + 1}/{total}] Sending to {name}...")
+
+                if bucket:
+                    bucket.acquire()
+                ok = self.send_message(phone, personalized_msg, name)
+
+                # Wait only until WhatsApp clears the pending clock icon
+                # (message delivered) instead of sleeping a fixed delay
+                self._wait_until_sent(delay_seconds)
+
+                yield {
+                    'index': i + 1,
+                    'total': total,
+                    'name': name,
+                    'phone': phone,
+                    'ok': ok
+                }
+
         finally:
-            # Close browser
-            if self.driver:
+            self._sent_w = None
+            self._fail_w = None
+            sent_f.close()
+            fail_f.close()
+            # Close browser (also runs when the caller breaks out early)
+            if close_when_done and self.driver:
                 self.driver.quit()
                 self.driver = None
-        
+
+    def send_bulk_messages(self, message: str, delay_seconds: int = 5,
+                           rate_per_minute: float = None, burst: int = 1) -> dict:
+        """
+        Send messages to all loaded contacts using single browser session
+        (blocking wrapper around iter_send_bulk)
+
+        Returns:
+            Dict with summary statistics, or None on setup failure
+        """
+        try:
+            for _ in self.iter_send_bulk(message, delay_seconds,
+                                         rate_per_minute=rate_per_minute,
+                                         burst=burst):
+                pass
+        except RuntimeError as e:
+            logger.error(str(e))
+            return None
+
         # Return summary
+        total = len(self.contacts_df)
         return {
-            'total': len(self.contacts),
-            'sent': len(self.sent_messages),
-            'failed': len(self.failed_messages),
-            'success_rate': (len(self.sent_messages) / len(self.contacts) * 100) if self.contacts else 0
+            'total': total,
+            'sent': self.n_sent,
+            'failed': self.n_failed,
+            'success_rate': (self.n_sent / total * 100) if total else 0
         }
-    
+
+    def send_bulk_parallel(self, message: str, num_workers: int = 2,
+                           delay_seconds: int = 5, rate_per_minute: float = None,
+                           burst: int = 1) -> dict:
+        """
+        Send messages with several Chrome workers in parallel
+
+        Each worker thread owns its own driver, its own chromedriver
+        Service, and its own persisted profile
+        (~/.whatsapp_sender_profile_0, _1, ...), so this only helps when
+        the profiles are logged into separate WhatsApp accounts - rate
+        limits are per account. Only the chromedriver binary path is
+        resolved once and shared; sharing a Service would let the first
+        worker to finish stop chromedriver under everyone else.
+
+        Args:
+            message: Message template (use {name} for personalization)
+            num_workers: Number of parallel Chrome sessions
+            delay_seconds: Max time to wait for each send confirmation
+            rate_per_minute: Per-worker token bucket rate (None = unpaced)
+            burst: Token bucket burst size
+
+        Returns:
+            Dict with summary statistics, or None if no contacts loaded
+        """
+        if self.contacts_df is None or self.contacts_df.empty:
+            logger.error("No contacts loaded. Call load_contacts() first.")
+            return None
+
+        # Resolve the chromedriver binary once; each worker still gets its
+        # own Service - driver.quit() stops the owning Service, and a second
+        # start on a shared one would rebind an already-bound port
+        driver_path = ChromeDriverManager().install()
+
+        # Round-robin partition so each worker gets a similar share
+        partitions = [self.contacts_df.iloc[i::num_workers] for i in range(num_workers)]
+
+        def run_worker(worker_id: int, contacts_df: pd.DataFrame):
+            worker = WhatsAppBulkSender(
+                wait_time=self.wait_time,
+                headless=self.headless,
+                profile_dir=PROFILE_DIR.with_name(f"{PROFILE_DIR.name}_{worker_id}")
+            )
+            worker.contacts_df = contacts_df.reset_index(drop=True)
+            worker._service = Service(driver_path)
+            # Per-worker report files so concurrent writers don't clobber
+            worker.sent_csv = self.sent_csv.with_stem(f"{self.sent_csv.stem}_{worker_id}")
+            worker.failed_csv = self.failed_csv.with_stem(f"{self.failed_csv.stem}_{worker_id}")
+            try:
+                for _ in worker.iter_send_bulk(message, delay_seconds,
+                                               rate_per_minute=rate_per_minute,
+                                               burst=burst):
+                    pass
+            except RuntimeError as e:
+                logger.error(f"Worker {worker_id}: {str(e)}")
+            return worker.n_sent, worker.n_failed
+
+        logger.info(f"Starting parallel send with {num_workers} workers")
+
+        self.n_sent = 0
+        self.n_failed = 0
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            for sent, failed in pool.map(run_worker, range(num_workers), partitions):
+                self.n_sent += sent
+                self.n_failed += failed
+
+        total = len(self.contacts_df)
+        return {
+            'total': total,
+            'sent': self.n_sent,
+            'failed': self.n_failed,
+            'success_rate': (self.n_sent / total * 100) if total else 0
+        }
+
+    @staticmethod
+    def _read_report_csv(path) -> list:
+        """Read a streamed report CSV back as a list of dicts, converting
+        the raw nanosecond timestamps to ISO text only here"""
+        try:
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+        except FileNotFoundError:
+            return []
+
+        for row in rows:
+            ts_ns = row.pop('ts_ns', None)
+            if ts_ns:
+                row['timestamp'] = datetime.fromtimestamp(int(ts_ns) / 1e9).isoformat()
+        return rows
+
     def get_report(self) -> dict:
-        """Get detailed report of sent/failed messages"""
+        """Get detailed report of sent/failed messages (read back from the
+        on-disk report CSVs)"""
         return {
-            'sent': self.sent_messages,
-            'failed': self.failed_messages,
+            'sent': self._read_report_csv(self.sent_csv),
+            'failed': self._read_report_csv(self.failed_csv),
             'summary': {
-                'total_sent': len(self.sent_messages),
-                'total_failed': len(self.failed_messages),
-                'success_rate': (len(self.sent_messages) / (len(self.sent_messages) + len(self.failed_messages)) * 100) 
-                                if (self.sent_messages or self.failed_messages) else 0
+                'total_sent': self.n_sent,
+                'total_failed': self.n_failed,
+                'success_rate': (self.n_sent / (self.n_sent + self.n_failed) * 100)
+                                if (self.n_sent or self.n_failed) else 0
             }
         }
     
@@ -238,4 +703,6 @@ class WhatsAppBulkSender:
         if self.driver:
             self.driver.quit()
             self.driver = None
+            self._primed = False
+            self._msg_box = self._send_btn = None
             logger.info("Browser closed")